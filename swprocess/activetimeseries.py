@@ -143,9 +143,11 @@ class ActiveTimeSeries(TimeSeries):
             msg = "`timeseries` is incompatible and cannot be stacked."
             raise ValueError(msg)
 
-        self._amp = (self._amp*self.nstacks +
-                     timeseries._amp*timeseries.nstacks)
-        self._amp /= (self.nstacks + timeseries.nstacks)
+        # Weighted average, computed in a single new buffer.
+        amp = self._amp*self.nstacks
+        amp += timeseries._amp*timeseries.nstacks
+        amp /= (self.nstacks + timeseries.nstacks)
+        self._amp = amp
         self._nstacks += timeseries.nstacks
 
     @classmethod
@@ -210,6 +212,59 @@ class ActiveTimeSeries(TimeSeries):
         return cls(amplitude=trace.data, dt=trace.stats.delta,
                    nstacks=nstacks, delay=delay)
 
+    @classmethod
+    def from_traces(cls, traces, nstacks=1, delay=0):
+        """Create `ActiveTimeSeries` by stacking several `Trace` objects.
+
+        Equivalent to creating an `ActiveTimeSeries` from each `Trace`
+        with :meth:`ActiveTimeSeries.from_trace` and stacking them
+        with :meth:`ActiveTimeSeries.stack_append`, but the stack is
+        computed in a single operation.
+
+        Parameters
+        ----------
+        traces : iterable of Trace
+            `Trace` objects with equal `stats.delta` and number of
+            samples.
+        nstacks : int, optional
+            Number of stacks each `Trace` represents, default is 1,
+            signifying single unstacked time records.
+        delay : float {<=0.}, optional
+            Denotes the pre-event delay, default is zero, meaning no
+            pre-event noise was recorded.
+
+        Returns
+        -------
+        ActiveTimeSeries
+            Initialized with the stack of `traces`.
+
+        Raises
+        ------
+        ValueError
+            If the `traces` are incompatible and cannot be stacked.
+
+        """
+        traces = list(traces)
+        if len(traces) == 0:
+            msg = "`traces` must contain at least one `Trace`."
+            raise ValueError(msg)
+
+        dt = traces[0].stats.delta
+        for trace in traces[1:]:
+            if trace.stats.delta != dt:
+                msg = "`traces` are incompatible and cannot be stacked."
+                raise ValueError(msg)
+
+        try:
+            amplitudes = np.stack([trace.data for trace in traces])
+        except ValueError as e:
+            msg = "`traces` are incompatible and cannot be stacked."
+            raise ValueError(msg) from e
+
+        amplitude = np.mean(amplitudes, axis=0, dtype=np.double)
+        return cls(amplitude=amplitude, dt=dt, nstacks=len(traces)*nstacks,
+                   delay=delay)
+
     def trim(self, start_time, end_time):
         """Trim in the interval [`start_time`, `end_time`].
 
@@ -254,7 +309,7 @@ class ActiveTimeSeries(TimeSeries):
 
         """
         df = float(df)
-        logger.info(f"zero_pad(df={df})")
+        logger.info("zero_pad(df=%s)", df)
         self._multiple = 1
         if df <= 0:
             raise ValueError(f"df must be positive, currently {df}.")
@@ -274,17 +329,20 @@ class ActiveTimeSeries(TimeSeries):
         elif new_nsamples < self.nsamples:
             # If df_old is already an integer of df_new
             if self.nsamples % new_nsamples == 0:
-                self._multiple = int(self.nsamples/new_nsamples)
+                self._multiple = self.nsamples // new_nsamples
                 return
             # If df_old is not already an integer of df_new, pad existing series.
             else:
                 padding = new_nsamples - (self.nsamples % new_nsamples)
-                self._multiple = int((self.nsamples + padding) / new_nsamples)
+                self._multiple = (self.nsamples + padding) // new_nsamples
         # If new_samples == nsamples, do nothing.
         else:
             return
 
-        self._amp = np.concatenate((self._amp, np.zeros((1, padding))), axis=1)
+        nseries, nsamples = self._amp.shape
+        amp = np.zeros((nseries, nsamples + padding), dtype=self._amp.dtype)
+        amp[:, :nsamples] = self._amp
+        self._amp = amp
 
     @staticmethod
     def crosscorr(a, b, correlate_kwargs=None, exclude=("nsamples")):
@@ -74,7 +74,7 @@ class Masw():
 
         # Acquire Workflow (class) from registry.
         selected_workflow = settings["workflow"]
-        logger.info(f"selected workflow is {selected_workflow}")
+        logger.info("selected workflow is %s", selected_workflow)
         Workflow = MaswWorkflowRegistry.create_class(selected_workflow)
 
         # Define workflow (instance) from Workflow (class).
@@ -23,7 +23,7 @@ import logging
 import numpy as np
 import matplotlib.pyplot as plt
 
-from .regex import get_peak_from_max, get_all, get_nmaxima
+from .regex import parse_peak_line, get_all, get_nmaxima
 
 logger = logging.getLogger("swprocess.peaks")
 
@@ -76,18 +76,38 @@ class Peaks():
         Peaks
             Instantiated `Peaks` object.
 
+        Raises
+        ------
+        ValueError
+            If any attribute's shape differs from that of `frequency`.
+
         """
-        self._frequency = np.array(frequency, dtype=float)
-        self._velocity = np.array(velocity, dtype=float)
-        self._valid = ~np.isnan(self._velocity)
+        self._frequency = self._to_array(frequency)
+        self._velocity = self._to_array(velocity)
+        self._derived_cache = {}
         self.identifier = str(identifier)
         self.attrs = ["frequency", "velocity"] + list(kwargs.keys())
 
-        logger.debug(f"Creating {self}")
-        logger.debug(f"  {self}.attrs={self.attrs}")
+        logger.debug("Creating %s", self)
+        logger.debug("  %s.attrs=%s", self, self.attrs)
 
         for key, val in kwargs.items():
-            setattr(self, f"_{key}", np.array(val, dtype=float))
+            setattr(self, f"_{key}", self._to_array(val))
+
+        # All attributes must be defined for each peak.
+        shape = self._frequency.shape
+        for attr in self.attrs[1:]:
+            if getattr(self, f"_{attr}").shape != shape:
+                msg = f"{attr} must have the same shape as frequency {shape}."
+                raise ValueError(msg)
+
+        # Peak is valid only if both frequency and velocity are defined.
+        self._valid = ~(np.isnan(self._frequency) | np.isnan(self._velocity))
+
+    @staticmethod
+    def _to_array(values):
+        """Copy `values` to a C-contiguous `ndarray` of floats."""
+        return np.array(values, dtype=float, order="C")
 
     @property
     def frequency(self):
@@ -115,27 +135,44 @@ class Peaks():
 
     @property
     def slowness(self):
-        return 1/self.velocity
+        return self._slowness[self._valid]
 
     @property
     def _slowness(self):
-        return 1/self._velocity
+        return self._derived("slowness", lambda: 1/self._velocity)
 
     @property
     def wavelength(self):
-        return self.velocity/self.frequency
+        return self._wavelength[self._valid]
 
     @property
     def _wavelength(self):
-        return self._velocity/self._frequency
+        return self._derived("wavelength",
+                             lambda: self._velocity/self._frequency)
 
     @property
     def wavenumber(self):
-        return 2*np.pi*self.frequency/self.velocity
+        return self._wavenumber[self._valid]
 
     @property
     def _wavenumber(self):
-        return 2*np.pi*self._frequency/self._velocity
+        return self._derived("wavenumber",
+                             lambda: 2*np.pi*self._frequency/self._velocity)
+
+    def _derived(self, name, calculate):
+        """Lazily calculate and cache a derived attribute.
+
+        Derived attributes depend only on `_frequency` and `_velocity`,
+        which are not modified after initialization (rejection only
+        updates `_valid`), so cached values never become stale.
+
+        """
+        try:
+            return self._derived_cache[name]
+        except KeyError:
+            value = calculate()
+            self._derived_cache[name] = value
+            return value
 
     @property
     def extended_attrs(self):
@@ -144,17 +181,29 @@ class Peaks():
         return self.attrs + others
 
     @classmethod
-    def _parse_peaks(cls, peak_data, wavetype="rayleigh", start_time=None, frequencies=None, nmaxima=None):
-        """Parse data for a given blockset."""
+    def _parse_peaks(cls, peak_data, wavetype="rayleigh", start_time=None, frequencies=None, nmaxima=None, found=None):
+        """Parse data for a given blockset.
+
+        If `found` is provided it is taken as the peaks of the blockset
+        already tokenized with :meth:`parse_peak_line`, so `peak_data`
+        is not re-scanned and the caller is responsible for checking
+        that no peaks were missed.
+
+        """
+        tokenized = found is not None
+        if not tokenized:
+            lines = (parse_peak_line(line, wavetype=wavetype)
+                     for line in peak_data.splitlines())
+            found = [line for line in lines if line is not None]
+
         if start_time is None:
-            regex = get_peak_from_max(wavetype=wavetype)
-            start_time, *_ = regex.search(peak_data).groups()
+            start_time = found[0][0]
+        if not tokenized:
+            found = [line for line in found if line[0] == start_time]
 
         if frequencies is None:
-            regex = get_peak_from_max(time=start_time, wavetype=wavetype)
             frequencies = []
-            for match in regex.finditer(peak_data):
-                _, f, *_ = match.groups()
+            for _, f, *_ in found:
                 if f in frequencies:
                     continue
                 else:
@@ -173,26 +222,36 @@ class Peaks():
         nois = np.full_like(frqs, fill_value=np.nan, dtype=float)
         pwrs = np.full_like(frqs, fill_value=np.nan, dtype=float)
 
-        for col, frequency in enumerate(frequencies):
-            getpeak = get_peak_from_max(time=start_time, wavetype=wavetype,
-                                        frequency=frequency)
-
-            for row, match in enumerate(getpeak.finditer(peak_data)):
-                _, _frq, _slo, _azi, _ell, _noi, _pwr = match.groups()
-
-                frqs[row, col] = float(_frq)
-                vels[row, col] = 1/float(_slo)
-                azis[row, col] = float(_azi)
-                ells[row, col] = float(_ell)
-                nois[row, col] = float(_noi)
-                pwrs[row, col] = float(_pwr)
+        # Single pass, locate peaks by frequency (col) in order found (row).
+        columns = {frequency: col for col, frequency in enumerate(frequencies)}
+        counts = [0]*nfrequencies
+        rows, cols, fields = [], [], []
+        for _, _frq, *_fields in found:
+            try:
+                col = columns[_frq]
+            except KeyError:
+                continue
+            rows.append(counts[col])
+            cols.append(col)
+            counts[col] += 1
+            fields.append((_frq, *_fields))
+
+        # Convert all fields at once, then scatter into place.
+        values = np.array(fields, dtype=float).reshape(-1, 6)
+        frqs[rows, cols] = values[:, 0]
+        vels[rows, cols] = 1/values[:, 1]
+        azis[rows, cols] = values[:, 2]
+        ells[rows, cols] = values[:, 3]
+        nois[rows, cols] = values[:, 4]
+        pwrs[rows, cols] = values[:, 5]
 
         # Include for "belt and suspenders".
-        getall = get_all(time=start_time, wavetype=wavetype)
-        count = len(getall.findall(peak_data))
-        if np.sum(~np.isnan(frqs)) != count:  # pragma: no cover
-            msg = f"Missing {count - len(frqs)} dispersion peaks."
-            raise ValueError(msg)
+        if not tokenized:
+            getall = get_all(time=start_time, wavetype=wavetype)
+            count = len(getall.findall(peak_data))
+            if np.sum(~np.isnan(frqs)) != count:  # pragma: no cover
+                msg = f"Missing {count - len(frqs)} dispersion peaks."
+                raise ValueError(msg)
 
         return cls(frqs, vels, identifier=start_time, azimuth=azis,
                    ellipticity=ells, noise=nois, power=pwrs)
@@ -26,7 +26,7 @@ from matplotlib.widgets import Cursor
 
 from .wavefieldtransforms import AbstractWavefieldTransform as AWTransform
 from .peaks import Peaks
-from .regex import get_nmaxima, get_peak_from_max
+from .regex import get_nmaxima, get_all, parse_peak_line
 
 logger = logging.getLogger("swprocess.peakssuite")
 
@@ -419,7 +419,7 @@ class PeaksSuite():
                     xtype[axclicked], xlims, ytype[axclicked], ylims)
                 rejection_count += np.sum(rejection_mask)
                 rejection_bool_arrays[index][rejection_mask] = True
-            logging.debug(f"\trejection_count = {rejection_count}")
+            logger.debug("\trejection_count = %s", rejection_count)
 
             # If latest rejection box has points, store and continue.
             if rejection_count > 0:
@@ -518,7 +518,7 @@ class PeaksSuite():
                 xmin, xmax = min(xs), max(xs)
                 ymin, ymax = min(ys), max(ys)
                 ax_index = fig.axes.index(axclicked[0])
-                logger.debug(f"\tax_index = {ax_index}")
+                logger.debug("\tax_index = %s", ax_index)
                 return ((xmin, xmax), (ymin, ymax), ax_index)
             else:
                 msg = "Both clicks must be on the same axes. Please try again."
@@ -689,8 +689,8 @@ class PeaksSuite():
         r_nums = data_matrix_2.size - r_nans
         utility_option_2 = (i_nans - r_nans) / (i_nums - r_nums + 1)
 
-        logger.debug(
-            f"utility_option_1={utility_option_1}, utility_option_2={utility_option_2}")
+        logger.debug("utility_option_1=%s, utility_option_2=%s",
+                     utility_option_1, utility_option_2)
         if utility_option_1 > utility_option_2:
             return (xx_1, data_matrix_1)
         else:
@@ -803,6 +803,7 @@ class PeaksSuite():
         """
         if isinstance(fnames, str):
             fnames = [fnames]
+        getall = get_all(wavetype=wavetype)
 
         peaks = []
         for fname in fnames:
@@ -813,29 +814,35 @@ class PeaksSuite():
             nmaxima = int(regex.search(peak_data).groups()[0])
             nmaxima = 1 if nmaxima <= 0 else nmaxima
 
-            regex = get_peak_from_max(wavetype=wavetype)
+            # Single pass, group tokenized peaks by time (blockset).
             frequencies = []
-            for match in regex.finditer(peak_data):
-                _, f, *_ = match.groups()
-                if f in frequencies:
+            blocksets = {}
+            for line in peak_data.splitlines():
+                fields = parse_peak_line(line, wavetype=wavetype)
+                if fields is None:
                     continue
-                else:
+                start_time, f, *_ = fields
+                if f not in frequencies:
                     frequencies.append(f)
+                blocksets.setdefault(start_time, []).append(fields)
 
-            regex = get_peak_from_max(wavetype=wavetype)
-            found_times = []
-            for found in regex.finditer(peak_data):
-                start_time = found.groups()[0]
-                if start_time in found_times:
-                    continue
-                found_times.append(start_time)
+            npeaks = 0
+            for start_time, found in blocksets.items():
                 peak = Peaks._parse_peaks(peak_data,
                                           wavetype=wavetype,
                                           start_time=start_time,
                                           frequencies=frequencies,
-                                          nmaxima=nmaxima)
+                                          nmaxima=nmaxima,
+                                          found=found)
+                npeaks += np.count_nonzero(~np.isnan(peak._frequency))
                 peaks.append(peak)
 
+            # Include for "belt and suspenders".
+            count = len(getall.findall(peak_data))
+            if npeaks != count:  # pragma: no cover
+                msg = f"Missing {count - npeaks} dispersion peaks in {fname}."
+                raise ValueError(msg)
+
         return cls.from_peaks(peaks)
 
     @classmethod
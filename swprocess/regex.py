@@ -17,15 +17,20 @@
 """Regular expression definitions."""
 
 import re
+from functools import lru_cache
 
-__all__ = ["get_peak_from_max", "get_nmaxima",  "get_all", "get_spac_ratio", "get_spac_ring"]
+__all__ = ["get_peak_from_max", "parse_peak_line", "get_nmaxima",  "get_all", "get_spac_ratio", "get_spac_ring"]
 
-NUMBER = "-?\d+.?\d*[eE]?[+-]?\d*"
+NUMBER = r"-?\d+\.?\d*(?:[eE][+-]?\d+)?"
+NANINF = f"{NUMBER}|-?inf|nan"
+_WAVETYPES = {wavetype: wavetype.capitalize() for wavetype in
+             ("rayleigh", "love", "vertical", "radial", "transverse")}
 
 
-def get_peak_from_max(time="\d+\.?\d*", wavetype="rayleigh",
-                      frequency="-?\d+.?\d*[eE]?[+-]?\d*"):
-    """Compile regular expression to extract peaks from a `.max` file.
+@lru_cache(maxsize=128)
+def get_peak_from_max(time=r"\d+\.?\d*", wavetype="rayleigh",
+                      frequency=NUMBER):
+    r"""Compile regular expression to extract peaks from a `.max` file.
 
     Parameters
     ----------
@@ -38,20 +43,54 @@ def get_peak_from_max(time="\d+\.?\d*", wavetype="rayleigh",
     Return
     ------
     Compiled Regular Expression
-        To extract peaks from a `.max` file.
+        To extract peaks from a `.max` file. Compiled expressions
+        are cached on the (hashable) arguments, so repeated calls
+        with the same arguments return the same object.
 
     """
     wavetype = validate_wavetypes(wavetype)
-    pattern = f"({time}) ({frequency}) {wavetype} ({NUMBER}) ({NUMBER}) ({NUMBER}) ({NUMBER}|-?inf|nan) ({NUMBER}) 1"
-    return re.compile(pattern)
+    pattern = f"({time}) ({frequency}) {wavetype} ({NUMBER}) ({NUMBER}) ({NUMBER}) ({NANINF}) ({NUMBER}) 1"
+    return re.compile(pattern, flags=re.ASCII)
+
+
+def parse_peak_line(line, wavetype="rayleigh"):
+    """Split a single line from a `.max` file into its peak fields.
+
+    Lines in a `.max` file are whitespace-delimited with a fixed
+    structure, so they may be tokenized directly rather than scanned
+    with :meth:`get_peak_from_max`.
+
+    Parameters
+    ----------
+    line : str
+        Single line from a `.max` file.
+    wavetype : {'rayleigh', 'love', 'vertical', 'radial', 'transverse'}, optional
+        Define a specific wavetype to extract, default is `'rayleigh'`.
+
+    Return
+    ------
+    tuple or None
+        Of the form `(time, frequency, slowness, azimuth, ellipticity,
+        noise, power)` where each entry is a `str`, identical to the
+        groups returned by :meth:`get_peak_from_max`. `None` if `line`
+        is not a valid peak of the requested `wavetype`.
+
+    """
+    wavetype = validate_wavetypes(wavetype)
+    parts = line.split()
+    if len(parts) != 9 or parts[2] != wavetype or parts[8] != "1":
+        return None
+    time, frequency, _, slowness, azimuth, ellipticity, noise, power, _ = parts
+    return (time, frequency, slowness, azimuth, ellipticity, noise, power)
 
 
 def get_nmaxima():
-    return re.compile("N_MAXIMA=(\d+)")
+    return re.compile(r"N_MAXIMA=(\d+)", flags=re.ASCII)
 
 
-def get_all(wavetype="rayleigh", time="(\d+\.?\d*)"):
-    """Compile regular expression to identify peaks from a `.max` file.
+@lru_cache(maxsize=128)
+def get_all(wavetype="rayleigh", time=r"(\d+\.?\d*)"):
+    r"""Compile regular expression to identify peaks from a `.max` file.
 
     Parameters
     ----------
@@ -64,23 +103,25 @@ def get_all(wavetype="rayleigh", time="(\d+\.?\d*)"):
     Return
     ------
     Compiled Regular Expression
-        To identify peaks from a `.max` file.
+        To identify peaks from a `.max` file. Compiled expressions
+        are cached on the (hashable) arguments, so repeated calls
+        with the same arguments return the same object.
 
     """
     wavetype = validate_wavetypes(wavetype)
-    pattern = f"{time} .* {wavetype} .* 1"
-    return re.compile(pattern)
+    pattern = rf"^{time} \S+ {wavetype} .*? 1[^\S\n]*$"
+    return re.compile(pattern, flags=re.ASCII | re.MULTILINE)
 
 def validate_wavetypes(wavetype):
-    if wavetype in ("rayleigh", "love", "vertical", "radial", "transverse"):
-        return wavetype.capitalize()
-    else:
-        raise ValueError(f"wavetype={wavetype}, not recognized.")
+    try:
+        return _WAVETYPES[wavetype]
+    except KeyError:
+        raise ValueError(f"wavetype={wavetype}, not recognized.") from None
 
 
-def get_spac_ratio(time="(-?\d+.?\d*[eE]?[+-]?\d*)", component="(0)",
-                   ring="(\d+)"):
-    """
+def get_spac_ratio(time=f"({NUMBER})", component="(0)",
+                   ring=r"(\d+)"):
+    r"""
     TODO (jpv): Finish docstring.
 
     Parameters
@@ -102,10 +143,10 @@ def get_spac_ratio(time="(-?\d+.?\d*[eE]?[+-]?\d*)", component="(0)",
         msg = f"component={component} is not allowed; only vertical component=0 is implemented."
         raise NotImplementedError(msg)
 
-    number = "(-?\d+.?\d*[eE]?[+-]?\d*)"
+    number = f"({NUMBER})"
 
     pattern = f"{time} {number} {component} {ring} {number}"
-    return re.compile(pattern)
+    return re.compile(pattern, flags=re.ASCII)
 
 
 def get_spac_ring():
@@ -113,6 +154,6 @@ def get_spac_ring():
     TODO (jpv): Finish docstring.
 
     """
-    number = "(-?\d+.?\d*[eE]?[+-]?\d*)"
-    pattern = f" --- Ring \({number} m, {number} m\)"
-    return re.compile(pattern)
+    number = f"({NUMBER})"
+    pattern = rf" --- Ring \({number} m, {number} m\)"
+    return re.compile(pattern, flags=re.ASCII)
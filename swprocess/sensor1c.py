@@ -17,24 +17,30 @@
 """Sensor1C class definition."""
 
 import logging
+from operator import attrgetter
 
 from swprocess import ActiveTimeSeries
 
 logger = logging.getLogger(name=__name__)
 
+_SENSOR1C_ARGS_GETTER = attrgetter("amplitude", "dt", "x", "y", "z",
+                                   "nstacks", "delay")
+
+# SU trace header keys.
+_SU_NSTACK_KEY = "number_of_horizontally_stacked_traces_yielding_this_trace"
+_SU_DELAY_KEY = "delay_recording_time"
+_SU_SCALECO_KEY = "scalar_to_be_applied_to_all_coordinates"
+_SU_X_KEY = "group_coordinate_x"
+_SU_Y_KEY = "group_coordinate_y"
+
 
 class Sensor1C(ActiveTimeSeries):
     """Class for single component sensor objects."""
 
-    def _set_position(self, x, y, z):
-        self._x = float(x)
-        self._y = float(y)
-        self._z = float(z)
-
     def __init__(self, amplitude, dt, x, y, z, nstacks=1, delay=0):
         """Initialize `Sensor1C`."""
         super().__init__(amplitude, dt, nstacks=nstacks, delay=delay)
-        self._set_position(x, y, z)
+        self._x, self._y, self._z = float(x), float(y), float(z)
 
     @property
     def x(self):
@@ -51,14 +57,8 @@ class Sensor1C(ActiveTimeSeries):
     @classmethod
     def from_sensor1c(cls, sensor1c):
         """Create deep copy of an existing `Sensor1C` object."""
-        arg_map = {"amplitude": lambda x: x, "dt": lambda x: x,
-                   "x": float, "y": float, "z": float}
-        args = [opr(getattr(sensor1c, arg)) for arg, opr in arg_map.items()]
-
-        kwarg_map = {"nstacks": int, "delay": float}
-        kwargs = {key: opr(getattr(sensor1c, key))
-                  for key, opr in kwarg_map.items()}
-        return cls(*args, **kwargs)
+        amplitude, dt, x, y, z, nstacks, delay = _SENSOR1C_ARGS_GETTER(sensor1c)
+        return cls(amplitude, dt, x, y, z, nstacks=nstacks, delay=delay)
 
     @classmethod
     def from_activetimeseries(cls, activetimeseries, x, y, z):
@@ -122,6 +122,39 @@ class Sensor1C(ActiveTimeSeries):
             return cls(amplitude=trace.data, dt=trace.stats.delta,
                        x=x, y=y, z=z, nstacks=nstacks, delay=delay)
 
+    @classmethod
+    def from_traces(cls, traces, nstacks=1, delay=0, x=0, y=0, z=0):
+        """Create a `Sensor1C` object by stacking several `Trace` objects.
+
+        Parameters
+        ----------
+        traces : iterable of Trace
+            `Trace` objects with equal `stats.delta` and number of
+            samples.
+        nstacks : int, optional
+            Number of stacks each `Trace` represents, default is 1
+            (i.e., no stacking).
+        delay : float, optional
+            Pre-trigger delay in seconds, default is 0 seconds.
+        x, y, z : float, optional
+            Receiver's relative position in x, y, and z, default is
+            zero for all components (i.e., the origin).
+
+        Returns
+        -------
+        Sensor1C
+            An initialized `Sensor1C` object.
+
+        Raises
+        ------
+        ValueError
+            If the `traces` are incompatible and cannot be stacked.
+
+        """
+        stack = ActiveTimeSeries.from_traces(traces, nstacks=nstacks,
+                                             delay=delay)
+        return cls.from_activetimeseries(stack, x, y, z)
+
     @classmethod
     def _from_trace_seg2(cls, trace, map_x=lambda x: x, map_y=lambda y: y):
         """Create a `Sensor1C` object form a SEG2-style `Trace` object.
@@ -170,19 +203,18 @@ class Sensor1C(ActiveTimeSeries):
 
         """
         header = trace.stats.su.trace_header
-        nstack_key = "number_of_horizontally_stacked_traces_yielding_this_trace"
-        scaleco = int(header["scalar_to_be_applied_to_all_coordinates"])
+        scaleco = int(header[_SU_SCALECO_KEY])
 
-        int_x = int(header["group_coordinate_x"])
+        int_x = int(header[_SU_X_KEY])
         x =  int_x / abs(scaleco) if scaleco < 0 else int_x * scaleco
 
-        int_y = int(header["group_coordinate_y"])
+        int_y = int(header[_SU_Y_KEY])
         y = int_y / abs(scaleco) if scaleco < 0 else int_x * scaleco
 
         return cls.from_trace(trace,
                               read_header=False,
-                              nstacks=int(header[nstack_key])+1,
-                              delay=int(header["delay_recording_time"])/1000,
+                              nstacks=int(header[_SU_NSTACK_KEY])+1,
+                              delay=int(header[_SU_DELAY_KEY])/1000,
                               x=map_x(x),
                               y=map_y(y),
                               z=0)
@@ -195,11 +227,13 @@ class Sensor1C(ActiveTimeSeries):
         if not isinstance(other, Sensor1C):
             return False
 
-        for attr in ["x", "y", "z"]:
-            if attr in exclude:
-                continue
-            if getattr(self, attr) != getattr(other, attr):
-                return False
+        # Check (cheap) position before (expensive) parent attributes.
+        if "x" not in exclude and self._x != other._x:
+            return False
+        if "y" not in exclude and self._y != other._y:
+            return False
+        if "z" not in exclude and self._z != other._z:
+            return False
 
         if not super()._is_similar(other, exclude=exclude):
             return False
@@ -45,7 +45,7 @@ class Source():
         self._x = float(x)
         self._y = float(y)
         self._z = float(z)
-        logger.info(f"Created {self}.")
+        logger.info("Created %s.", self)
 
     @property
     def x(self):
@@ -95,8 +95,8 @@ class Statistics():
             # diff_stddev = np.max(np.abs(new_stddev - stddev))
             # p_diff_stddev = np.max(np.abs((new_stddev - stddev)/stddev))
 
-            logger.info(f"  p_diff_mean = {p_diff_mean}")
-            logger.info(f"  diff_cov = {diff_cov}")
+            logger.info("  p_diff_mean = %s", p_diff_mean)
+            logger.info("  diff_cov = %s", diff_cov)
 
             if p_diff_mean < 0.05 and diff_cov < 0.01:
                 break
@@ -185,8 +185,8 @@ class Statistics():
         r_nums = data_matrix_2.size - r_nans
         utility_option_2 = (i_nans - r_nans) / (i_nums - r_nums + 1)
 
-        logger.debug(
-            f"utility_option_1={utility_option_1}, utility_option_2={utility_option_2}")
+        logger.debug("utility_option_1=%s, utility_option_2=%s",
+                     utility_option_1, utility_option_2)
         if utility_option_1 > utility_option_2:
             return (xx_1, data_matrix_1)
         else:
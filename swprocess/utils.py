@@ -16,19 +16,23 @@
 
 """Surface wave processing utilities."""
 
-import os
-import datetime
+import io
+import csv
+import shutil
 import logging
 import warnings
+import pathlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import obspy
-import pandas as pd
 
 logger = logging.getLogger("swprocess.utils")
 
 
-def extract_mseed(startend_fname, network, data_dir="./", output_dir="./", extension="mseed"):
+def extract_mseed(startend_fname, network, data_dir="./", output_dir="./",
+                  extension="mseed", max_workers=1):
     """Extract specific time blocks from a set of miniseed files.
 
     Reads a large set of miniseed files, trims out specified time
@@ -41,8 +45,8 @@ def extract_mseed(startend_fname, network, data_dir="./", output_dir="./", exten
     Parameters
     ----------
     startend_fname : str
-        Name of .csv file with start and end times. An example file is
-        provided `here <https://github.com/jpvantassel/swprocess/blob/main/examples/extract/extract_startandend.csv>`_
+        Name of comma-delimited text file (e.g., .csv) with start and
+        end times. An example file is provided `here <https://github.com/jpvantassel/swprocess/blob/main/examples/extract/extract_startandend.csv>`_
     network : str
         Short string of characters to identify the network. Exported
         files will utilize this network code as its prefix.
@@ -54,98 +58,133 @@ def extract_mseed(startend_fname, network, data_dir="./", output_dir="./", exten
         output miniseed files, default is the current directory.
     extension : {"mseed", "miniseed"}, optional
         Extension used for miniSEED format, default is `"mseed"`.
+    max_workers : int, optional
+        Maximum number of processes used to extract time blocks
+        concurrently, default is `1` so rows are extracted serially
+        and the first failing row stops the extraction. Values greater
+        than one extract rows in a process pool; threads are not used
+        because obspy's miniSEED reader and writer are not thread-safe.
+        In a pool, rows other than a failing one may still be written
+        and the calling script requires an `if __name__ == "__main__"`
+        guard.
 
     Returns
     -------
     None
         Writes folder and files to disk.
 
+    Raises
+    ------
+    NotImplementedError
+        If `startend_fname` is not a comma-delimited text file.
+    ValueError
+        If an end time is before its corresponding start time.
+
     """
     # Read start and end times.
     dtype = {"folder name": str, "array name": str, "station number": int,
-             "start year": int, "start month": int, "start day": int,
+             "start year": int, "start month": int, "start date": int,
              "start hour": int, "start minute": int, "start second": int,
-             "end year": int, "end month": int, "end day": int,
+             "end year": int, "end month": int, "end date": int,
              "end hour": int, "end minute": int, "end second": int,
              "notes": str}
     try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            df = pd.read_csv(startend_fname, dtype=dtype)
-    except:
-        raise NotImplementedError("File type not recognized.")
-
-    # Loop through across defined timeblocks.
-    logger.info("Begin iteration across dataframe ...")
-    total = df["folder name"].count()
-    for index, series in df.iterrows():
-        logger.debug(f"\tindex={index} series={series}")
-
-        # Start and end time.
-        starttime = datetime.datetime(year=series["start year"],
-                                      month=series["start month"],
-                                      day=series["start date"],
-                                      hour=series["start hour"],
-                                      tzinfo=datetime.timezone.utc)
-        logging.debug(f"\t\tstarttime={starttime}")
-        currenttime = starttime
-
-        endtime = datetime.datetime(year=series["end year"],
-                                    month=series["end month"],
-                                    day=series["end date"],
-                                    hour=series["end hour"],
-                                    tzinfo=datetime.timezone.utc)
-        logging.debug(f"\t\tendtime={endtime}")
-
-        # Avoid nonsensical time blocks.
-        if endtime < starttime:
-            msg = f"endtime={endtime} is less than starttime={starttime}."
-            raise ValueError(msg)
-
-        # Loop across the required hours and merge traces.
-        append = False
-        dt = datetime.timedelta(hours=1)
-        while currenttime <= endtime:
-
-            # miniSEED file name: NW.STNSN_SENSOR_YYYYMMDD_HH0000.miniseed
-            fname = f"{network}.STN{str(series['station number']).zfill(2)}_{currenttime.year}{str(currenttime.month).zfill(2)}{str(currenttime.day).zfill(2)}_{str(currenttime.hour).zfill(2)}0000.{extension}"
-
-            # Read current file and append if necessary
-            if append:
-                master += obspy.read(f"{data_dir}{fname}")
-            else:
-                master = obspy.read(f"{data_dir}{fname}")
-                append = True
-
-            currenttime += dt
-
-        master = master.merge(method=1)
-
-        # Trim merged traces between specified start and end times
-        trim_start = obspy.UTCDateTime(series["start year"], series["start month"],
-                                       series["start date"], series["start hour"],
-                                       series["start minute"], series["start second"])
-        trim_end = obspy.UTCDateTime(series["end year"], series["end month"],
-                                     series["end date"], series["end hour"],
-                                     series["end minute"], series["end second"])
-        master.trim(starttime=trim_start, endtime=trim_end)
-
-        # Store new miniseed files in folder titled "Array Miniseed"
-        folder = series["folder name"]
-        if not os.path.isdir(f"{output_dir}{folder}"):
-            logger.info(f"Creating folder: {output_dir}{folder}")
-            os.mkdir(f"{output_dir}{folder}")
-
-        # Unmask masked array.
+        with open(startend_fname, "r", newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            for key, value in row.items():
+                row[key] = dtype.get(key, str)(value)
+    except (UnicodeDecodeError, csv.Error, TypeError, ValueError) as e:
+        raise NotImplementedError("File type not recognized.") from e
+
+    data_path = pathlib.Path(data_dir)
+    out_path = pathlib.Path(output_dir)
+
+    # Loop across defined timeblocks.
+    logger.info("Begin iteration across rows ...")
+    total = len(rows)
+    extract = functools.partial(_extract_one_row, total=total,
+                                network=network, data_path=data_path,
+                                out_path=out_path, extension=extension)
+    if max_workers == 1:
+        for index, series in enumerate(rows):
+            extract(index, series)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(extract, range(total), rows))
+
+
+def _extract_one_row(index, series, total, network, data_path, out_path,
+                     extension):
+    """Extract the time block defined by a single row, see `extract_mseed`."""
+    logger.debug("\tindex=%s series=%s", index, series)
+
+    # Row-invariant components of the file names.
+    station = f"{int(series['station number']):02d}"
+    prefix = f"{network}.STN{station}_"
+    folder = series["folder name"]
+    folder_path = out_path / folder
+
+    # Start and end time.
+    starttime = obspy.UTCDateTime(series["start year"], series["start month"],
+                                  series["start date"], series["start hour"])
+    logger.debug("\t\tstarttime=%s", starttime)
+    currenttime = starttime
+
+    endtime = obspy.UTCDateTime(series["end year"], series["end month"],
+                                series["end date"], series["end hour"])
+    logger.debug("\t\tendtime=%s", endtime)
+
+    # Avoid nonsensical time blocks.
+    if endtime < starttime:
+        msg = f"endtime={endtime} is less than starttime={starttime}."
+        raise ValueError(msg)
+
+    # Loop across the required hours to find the necessary files.
+    fnames = []
+    dt = 3600.
+    while currenttime <= endtime:
+
+        # miniSEED file name: NW.STNSN_SENSOR_YYYYMMDD_HH0000.miniseed
+        fname = f"{prefix}{currenttime.strftime('%Y%m%d_%H0000')}.{extension}"
+        fnames.append(data_path / fname)
+
+        currenttime += dt
+
+    # miniSEED is record-based, so concatenate files and read once.
+    buffer = io.BytesIO()
+    for fname in fnames:
+        with open(fname, "rb") as f:
+            shutil.copyfileobj(f, buffer)
+    buffer.seek(0)
+    master = obspy.read(buffer, format="MSEED")
+
+    # Merging (and unmasking) is only necessary for multiple traces.
+    if len(master) > 1:
+        # get_gaps also reports overlaps, with a negative duration.
+        if any(gap[6] > 0 for gap in master.get_gaps()):
+            msg = f"{folder}/{network}.STN{station} has gaps, filling with zeros."
+            warnings.warn(msg)
+        master = master.merge(method=1, fill_value=0)
+
+        # Unmask masked array, should not occur given fill_value=0.
         for tr in master:
             if isinstance(tr.data, np.ma.masked_array):
-                tr.data = tr.data.filled()
-                msg = f"{folder}/{network}.STN{str(series['station number']).zfill(2)} was a masked array."
+                tr.data = np.asarray(tr.data.filled(0), dtype=tr.data.dtype)
+                msg = f"{folder}/{network}.STN{station} was a masked array."
                 warnings.warn(msg)
 
-        # Write trimmed file to disk.
-        fname_out = f"{output_dir}{folder}/{network}.STN{str(series['station number']).zfill(2)}.{series['array name']}.{extension}"
-        logger.info(
-            f"Extracted {index+1} of {total}. Extracting data from station {str(series['station number']).zfill(2)}. Creating file: {fname_out}.")
+    # Trim merged traces between specified start and end times
+    trim_start = starttime + 60*series["start minute"] + series["start second"]
+    trim_end = endtime + 60*series["end minute"] + series["end second"]
+    master.trim(starttime=trim_start, endtime=trim_end)
+
+    # Store new miniseed files in folder titled "Array Miniseed"
+    folder_path.mkdir(parents=True, exist_ok=True)
+
+    # Write trimmed file to disk.
+    fname_out = folder_path / f"{network}.STN{station}.{series['array name']}.{extension}"
+    logger.info("Extracted %d of %d. Extracting data from station %s. "
+                "Creating file: %s.", index+1, total, station, fname_out)
 
-        master.write(fname_out, format="mseed")
+    master.write(str(fname_out), format="mseed")
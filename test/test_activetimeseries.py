@@ -107,6 +107,33 @@ class Test_ActiveTimeSeries(TestCase):
         self.assertEqual(int(trace.stats.seg2.STACK), tseries._nstacks)
         self.assertEqual(float(trace.stats.seg2.DELAY), tseries.delay)
 
+    def test_from_traces(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            traces = [obspy.read(self.wghs_path + f"{i}.dat")[0]
+                      for i in range(1, 4)]
+
+        # Equivalent to stacking with stack_append.
+        expected = swprocess.ActiveTimeSeries.from_trace(traces[0])
+        for trace in traces[1:]:
+            expected.stack_append(swprocess.ActiveTimeSeries.from_trace(trace))
+        returned = swprocess.ActiveTimeSeries.from_traces(traces)
+        self.assertEqual(expected, returned)
+        self.assertEqual(3, returned.nstacks)
+
+        # Bad stack
+        traces[1].stats.delta *= 2
+        self.assertRaises(ValueError, swprocess.ActiveTimeSeries.from_traces,
+                          traces)
+        traces[1].stats.delta /= 2
+        traces[1].data = traces[1].data[:-1]
+        self.assertRaises(ValueError, swprocess.ActiveTimeSeries.from_traces,
+                          traces)
+
+        # No traces
+        self.assertRaises(ValueError, swprocess.ActiveTimeSeries.from_traces,
+                          [])
+
     def test_stack_append(self):
         # Append trace with 1 stack.
         tseries = swprocess.ActiveTimeSeries(amplitude=[0, 1, 0, -1], dt=1)
@@ -126,6 +153,20 @@ class Test_ActiveTimeSeries(TestCase):
         expected = (10*3 + 5*5)/(3+5)
         self.assertEqual(expected, returned)
 
+        # Append trace to itself.
+        tseries = swprocess.ActiveTimeSeries([1., 2., 3.], dt=1, nstacks=2)
+        tseries.stack_append(tseries)
+        self.assertArrayEqual(np.array([1., 2., 3.]), tseries.amplitude)
+        self.assertEqual(4, tseries.nstacks)
+
+        # Previously returned amplitude is left unchanged.
+        tseries = swprocess.ActiveTimeSeries([1., 2., 3.], dt=1)
+        nseries = swprocess.ActiveTimeSeries([3., 4., 5.], dt=1)
+        amplitude = tseries.amplitude
+        tseries.stack_append(nseries)
+        self.assertArrayEqual(np.array([1., 2., 3.]), amplitude)
+        self.assertArrayEqual(np.array([2., 3., 4.]), tseries.amplitude)
+
         # Bad stack
         tseries = swprocess.ActiveTimeSeries([1, 2, 3], dt=1)
         nseries = swprocess.ActiveTimeSeries([0, 0, 0], dt=2)
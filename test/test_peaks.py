@@ -21,6 +21,8 @@ import warnings
 from unittest.mock import MagicMock
 
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import pandas as pd
 
@@ -70,56 +72,92 @@ class Test_Peaks(TestCase):
                      [35, 13, np.nan]]
         cls.valid = np.array([[False, True, True], [True, True, False]])
 
+        # Convert once, reused across tests.
+        cls._frq_arr = np.array(cls.frq)
+        cls._vel_arr = np.array(cls.vel)
+        cls._azi_arr = np.array(cls.azi)
+        cls._ell_arr = np.array(cls.ell)
+        cls._noi_arr = np.array(cls.noi)
+        cls._pwr_arr = np.array(cls.pwr)
+
+        cls._frq2_arr = np.array(cls.frq2)
+        cls._vel2_arr = np.array(cls.vel2)
+        cls._azi2_arr = np.array(cls.azi2)
+        cls._ell2_arr = np.array(cls.ell2)
+        cls._noi2_arr = np.array(cls.noi2)
+        cls._pwr2_arr = np.array(cls.pwr2)
+
+        cls._frq2n_arr = np.array(cls.frq2n)
+        cls._vel2n_arr = np.array(cls.vel2n)
+        cls._azi2n_arr = np.array(cls.azi2n)
+        cls._ell2n_arr = np.array(cls.ell2n)
+        cls._noi2n_arr = np.array(cls.noi2n)
+        cls._pwr2n_arr = np.array(cls.pwr2n)
+
+        cls._frq2_flat = cls._frq2_arr.ravel()
+        cls._vel2_flat = cls._vel2_arr.ravel()
+        cls._azi2_flat = cls._azi2_arr.ravel()
+        cls._ell2_flat = cls._ell2_arr.ravel()
+        cls._noi2_flat = cls._noi2_arr.ravel()
+        cls._pwr2_flat = cls._pwr2_arr.ravel()
+
     def test_init(self):
         # 1D: No keyword arguments
         peaks = swprocess.Peaks(self.frq, self.vel, identifier=self._id)
-        self.assertArrayEqual(np.array(self.frq), peaks.frequency)
-        self.assertArrayEqual(np.array(self.vel), peaks.velocity)
+        self.assertArrayEqual(self._frq_arr, peaks.frequency)
+        self.assertArrayEqual(self._vel_arr, peaks.velocity)
         self.assertEqual(self._id, peaks.identifier)
 
         # 1D: Four keyword arguments
         peaks = swprocess.Peaks(self.frq, self.vel, identifier=self._id,
                                 azimuth=self.azi, ellipticity=self.ell,
                                 noise=self.noi, power=self.pwr)
-        self.assertArrayEqual(np.array(self.frq), peaks.frequency)
-        self.assertArrayEqual(np.array(self.vel), peaks.velocity)
+        self.assertArrayEqual(self._frq_arr, peaks.frequency)
+        self.assertArrayEqual(self._vel_arr, peaks.velocity)
         self.assertEqual(self._id, peaks.identifier)
-        self.assertArrayEqual(np.array(self.azi), peaks.azimuth)
-        self.assertArrayEqual(np.array(self.ell), peaks.ellipticity)
-        self.assertArrayEqual(np.array(self.noi), peaks.noise)
-        self.assertArrayEqual(np.array(self.pwr), peaks.power)
+        self.assertArrayEqual(self._azi_arr, peaks.azimuth)
+        self.assertArrayEqual(self._ell_arr, peaks.ellipticity)
+        self.assertArrayEqual(self._noi_arr, peaks.noise)
+        self.assertArrayEqual(self._pwr_arr, peaks.power)
 
         # 2D: Four keyword arguments
         peaks = swprocess.Peaks(self.frq2, self.vel2, identifier=self._id2,
                                 azimuth=self.azi2, ellipticity=self.ell2,
                                 noise=self.noi2, power=self.pwr2)
-        self.assertArrayEqual(np.array(self.frq2).flatten(), peaks.frequency)
-        self.assertArrayEqual(np.array(self.vel2).flatten(), peaks.velocity)
+        self.assertArrayEqual(self._frq2_flat, peaks.frequency)
+        self.assertArrayEqual(self._vel2_flat, peaks.velocity)
         self.assertEqual(self._id2, peaks.identifier)
-        self.assertArrayEqual(np.array(self.azi2).flatten(), peaks.azimuth)
-        self.assertArrayEqual(np.array(self.ell2).flatten(), peaks.ellipticity)
-        self.assertArrayEqual(np.array(self.noi2).flatten(), peaks.noise)
-        self.assertArrayEqual(np.array(self.pwr2).flatten(), peaks.power)
+        self.assertArrayEqual(self._azi2_flat, peaks.azimuth)
+        self.assertArrayEqual(self._ell2_flat, peaks.ellipticity)
+        self.assertArrayEqual(self._noi2_flat, peaks.noise)
+        self.assertArrayEqual(self._pwr2_flat, peaks.power)
 
         # 2D: Four keyword arguments with nans
         peaks = swprocess.Peaks(self.frq2n, self.vel2n, identifier=self._id2n,
                                 azimuth=self.azi2n, ellipticity=self.ell2n,
                                 noise=self.noi2n, power=self.pwr2n)
-        self.assertArrayEqual(np.array(self.frq2n)[
-                              self.valid], peaks.frequency)
-        self.assertArrayEqual(np.array(self.vel2n)[self.valid], peaks.velocity)
+        self.assertArrayEqual(self._frq2n_arr[self.valid], peaks.frequency)
+        self.assertArrayEqual(self._vel2n_arr[self.valid], peaks.velocity)
         self.assertEqual(self._id2n, peaks.identifier)
-        self.assertArrayEqual(np.array(self.azi2n)[self.valid], peaks.azimuth)
-        self.assertArrayEqual(np.array(self.ell2n)[
-                              self.valid], peaks.ellipticity)
-        self.assertArrayEqual(np.array(self.noi2n)[self.valid], peaks.noise)
-        self.assertArrayEqual(np.array(self.pwr2n)[self.valid], peaks.power)
+        self.assertArrayEqual(self._azi2n_arr[self.valid], peaks.azimuth)
+        self.assertArrayEqual(self._ell2n_arr[self.valid], peaks.ellipticity)
+        self.assertArrayEqual(self._noi2n_arr[self.valid], peaks.noise)
+        self.assertArrayEqual(self._pwr2n_arr[self.valid], peaks.power)
+
+        # 1D: Undefined frequency or velocity -> invalid
+        peaks = swprocess.Peaks([np.nan, 2, 3], [4, 5, np.nan])
+        self.assertArrayEqual(np.array([False, True, False]), peaks._valid)
+
+        # Bad: inconsistent shapes
+        self.assertRaises(ValueError, swprocess.Peaks, self.frq, self.vel[:-1])
+        self.assertRaises(ValueError, swprocess.Peaks, self.frq, self.vel,
+                          azimuth=self.azi2)
 
     def test_properties(self):
         peaks = swprocess.Peaks(self.frq, self.vel, self._id, azimuth=self.azi)
 
         # Wavelength
-        self.assertArrayEqual(np.array(self.vel)/np.array(self.frq),
+        self.assertArrayEqual(self._vel_arr/self._frq_arr,
                               peaks.wavelength)
 
         # Extended Attrs
@@ -132,6 +170,15 @@ class Test_Peaks(TestCase):
         self.assertArrayAlmostEqual(2*np.pi/peaks.wavelength,
                                     peaks.wavenumber)
 
+        # Derived attributes are cached.
+        for attr in ["_wavelength", "_slowness", "_wavenumber"]:
+            self.assertIs(getattr(peaks, attr), getattr(peaks, attr))
+
+        # Cached derived attributes respect later rejection.
+        peaks.reject_limits_outside("frequency", (None, 50))
+        self.assertArrayEqual(self._vel_arr[1:]/self._frq_arr[1:],
+                              peaks.wavelength)
+
     def test_prepare_types(self):
         # Acceptable (will cast)
         kwargs = dict(xtype="frequency", ytype="velocity")
@@ -158,17 +205,18 @@ class Test_Peaks(TestCase):
     def test__plot(self):
         peaks = swprocess.Peaks(self.frq, self.vel, self._id)
 
-        # Standard
+        # Share one Figure and Axes across cases, Axes creation is slow.
         fig, ax = plt.subplots()
+
+        # Standard
         peaks._plot(ax=ax, xtype="frequency", ytype="velocity")
 
         # Bad Attribute
-        fig, ax = plt.subplots()
+        ax.cla()
         self.assertRaises(AttributeError, peaks._plot, ax=ax,
                           xtype="magic", ytype="size_of_unicorn")
 
-        plt.show(block=False)
-        plt.close("all")
+        plt.close(fig)
 
     def test_configure_axes(self):
         peaks = swprocess.Peaks(self.frq, self.vel, self._id)
@@ -240,8 +288,9 @@ class Test_Peaks(TestCase):
                                 ytype="velocity", ylims=(3.5, 8.5))
         keep_ids = [0, 1, 2, 5, 6, 8, 9, 10]
         attrs = dict(frequency=xs, velocity=ys, power=power)
-        for attr, value in attrs.items():
-            self.assertArrayEqual(value[keep_ids], getattr(peaks, attr))
+        expected = np.stack(list(attrs.values()))[:, keep_ids]
+        returned = np.stack([getattr(peaks, attr) for attr in attrs])
+        self.assertArrayEqual(expected, returned)
 
         # Reject on frequency and power.
         peaks = swprocess.Peaks(xs, ys, power=power)
@@ -249,8 +298,9 @@ class Test_Peaks(TestCase):
                                 ytype="power", ylims=(3.5, 8.5))
         keep_ids = [0, 1, 2, 5, 6, 8, 9, 10]
         attrs = dict(frequency=xs, velocity=ys, power=power)
-        for attr, value in attrs.items():
-            self.assertArrayEqual(value[keep_ids], getattr(peaks, attr))
+        expected = np.stack(list(attrs.values()))[:, keep_ids]
+        returned = np.stack([getattr(peaks, attr) for attr in attrs])
+        self.assertArrayEqual(expected, returned)
 
         # Reject on wavelength and slowness.
         ws = np.array([1, 5, 8, np.nan, 6, 4, 7, 7, 1, 3, 5])
@@ -266,8 +316,9 @@ class Test_Peaks(TestCase):
 
         keep_ids = [0, 2, 4, 8, 9]
         attrs = dict(frequency=xs, velocity=ys, power=power)
-        for attr, value in attrs.items():
-            self.assertArrayEqual(value[keep_ids], getattr(peaks, attr))
+        expected = np.stack(list(attrs.values()))[:, keep_ids]
+        returned = np.stack([getattr(peaks, attr) for attr in attrs])
+        self.assertArrayEqual(expected, returned)
 
     def test_simplify_mpeaks(self):
         # 1D: Four attributes.
@@ -359,8 +410,8 @@ class Test_Peaks(TestCase):
         # 1D: No keyword arguments.
         data = {"frequency": self.frq, "velocity": self.vel}
         peaks = swprocess.Peaks.from_dict(data, identifier=self._id)
-        self.assertArrayEqual(np.array(self.frq), peaks.frequency)
-        self.assertArrayEqual(np.array(self.vel), peaks.velocity)
+        self.assertArrayEqual(self._frq_arr, peaks.frequency)
+        self.assertArrayEqual(self._vel_arr, peaks.velocity)
         self.assertEqual(self._id, peaks.identifier)
 
         # 1D: Four keyword arguments.
@@ -368,41 +419,41 @@ class Test_Peaks(TestCase):
                 "azimuth": self.azi, "ellipticity": self.ell,
                 "noise": self.noi, "power": self.pwr}
         peaks = swprocess.Peaks.from_dict(data, identifier=self._id)
-        self.assertArrayEqual(np.array(self.frq), peaks.frequency)
-        self.assertArrayEqual(np.array(self.vel), peaks.velocity)
-        self.assertArrayEqual(np.array(self.azi), peaks.azimuth)
-        self.assertArrayEqual(np.array(self.ell), peaks.ellipticity)
-        self.assertArrayEqual(np.array(self.noi), peaks.noise)
-        self.assertArrayEqual(np.array(self.pwr), peaks.power)
+        self.assertArrayEqual(self._frq_arr, peaks.frequency)
+        self.assertArrayEqual(self._vel_arr, peaks.velocity)
+        self.assertArrayEqual(self._azi_arr, peaks.azimuth)
+        self.assertArrayEqual(self._ell_arr, peaks.ellipticity)
+        self.assertArrayEqual(self._noi_arr, peaks.noise)
+        self.assertArrayEqual(self._pwr_arr, peaks.power)
 
         # 2D: Four keyword arguments.
         data = {"frequency": self.frq2, "velocity": self.vel2,
                 "azimuth": self.azi2, "ellipticity": self.ell2,
                 "noise": self.noi2, "power": self.pwr2}
         peaks = swprocess.Peaks.from_dict(data, identifier=self._id2)
-        self.assertArrayEqual(np.array(self.frq2).flatten(), peaks.frequency)
-        self.assertArrayEqual(np.array(self.vel2).flatten(), peaks.velocity)
-        self.assertArrayEqual(np.array(self.azi2).flatten(), peaks.azimuth)
-        self.assertArrayEqual(np.array(self.ell2).flatten(), peaks.ellipticity)
-        self.assertArrayEqual(np.array(self.noi2).flatten(), peaks.noise)
-        self.assertArrayEqual(np.array(self.pwr2).flatten(), peaks.power)
+        self.assertArrayEqual(self._frq2_flat, peaks.frequency)
+        self.assertArrayEqual(self._vel2_flat, peaks.velocity)
+        self.assertArrayEqual(self._azi2_flat, peaks.azimuth)
+        self.assertArrayEqual(self._ell2_flat, peaks.ellipticity)
+        self.assertArrayEqual(self._noi2_flat, peaks.noise)
+        self.assertArrayEqual(self._pwr2_flat, peaks.power)
 
         # 2D: Four keyword arguments with nan.
         data = {"frequency": self.frq2n, "velocity": self.vel2n,
                 "azimuth": self.azi2n, "ellipticity": self.ell2n,
                 "noise": self.noi2n, "power": self.pwr2n}
         peaks = swprocess.Peaks.from_dict(data, identifier=self._id2)
-        self.assertArrayAlmostEqual(np.array(self.frq2n), peaks._frequency,
+        self.assertArrayAlmostEqual(self._frq2n_arr, peaks._frequency,
                                     equal_nan=True)
-        self.assertArrayAlmostEqual(np.array(self.vel2n), peaks._velocity,
+        self.assertArrayAlmostEqual(self._vel2n_arr, peaks._velocity,
                                     equal_nan=True)
-        self.assertArrayAlmostEqual(np.array(self.azi2n), peaks._azimuth,
+        self.assertArrayAlmostEqual(self._azi2n_arr, peaks._azimuth,
                                     equal_nan=True)
-        self.assertArrayAlmostEqual(np.array(self.ell2n), peaks._ellipticity,
+        self.assertArrayAlmostEqual(self._ell2n_arr, peaks._ellipticity,
                                     equal_nan=True)
-        self.assertArrayAlmostEqual(np.array(self.noi2n), peaks._noise,
+        self.assertArrayAlmostEqual(self._noi2n_arr, peaks._noise,
                                     equal_nan=True)
-        self.assertArrayAlmostEqual(np.array(self.pwr2n), peaks._power,
+        self.assertArrayAlmostEqual(self._pwr2n_arr, peaks._power,
                                     equal_nan=True)
 
         # Bad: missing frequency or velocity
@@ -19,6 +19,7 @@
 import json
 import os
 import logging
+import tempfile
 import warnings
 from unittest.mock import patch, MagicMock, call
 
@@ -674,6 +675,20 @@ class Test_PeaksSuite(TestCase):
                             expected[index], returned, places=4)
                         index += 1
 
+        # Trailing whitespace on peak lines is ignored.
+        expected = swprocess.PeaksSuite.from_max(fname_max)
+        with open(fname_max, "r") as f:
+            lines = [line.rstrip("\n") + " \n" if line[0].isdigit() else line
+                     for line in f]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fname = os.path.join(tmp_dir, "trailing_whitespace.max")
+            with open(fname, "w") as f:
+                f.writelines(lines)
+            returned = swprocess.PeaksSuite.from_max(fname)
+            self.assertEqual(expected, returned)
+            self.assertEqual(swprocess.Peaks.from_max(fname_max),
+                             swprocess.Peaks.from_max(fname))
+
     def test_from_peakssuite(self):
         frq = [0, 1, 2, 3]
         vel = [1, 2, 3, 4]
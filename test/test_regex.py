@@ -18,7 +18,7 @@
 
 import logging
 
-from swprocess.regex import get_peak_from_max
+from swprocess.regex import get_peak_from_max, get_all, parse_peak_line
 from testtools import unittest, TestCase, get_full_path
 
 logger = logging.getLogger("swprocess")
@@ -32,5 +32,50 @@ class Test_PeaksSuite(TestCase):
         pass
         # txt = "20201021184000.000000 0.88707185499315710508 Rayleigh 0.0052274209500743342924 146.16012705150347983 -9.7624928074594592431 4.1036102507755423119 2.4140442228149637278e-05 1"
 
+    def test_parse_peak_line(self):
+        txt = "20201021184000.000000 0.88707185499315710508 Rayleigh 0.0052274209500743342924 146.16012705150347983 -9.7624928074594592431 4.1036102507755423119 2.4140442228149637278e-05 1"
+
+        # Parse line -> same groups as regular expression.
+        expected = get_peak_from_max(wavetype="rayleigh").search(txt).groups()
+        returned = parse_peak_line(txt, wavetype="rayleigh")
+        self.assertTupleEqual(expected, returned)
+
+        # Wrong wavetype, comment, and invalid peak -> None.
+        self.assertIsNone(parse_peak_line(txt, wavetype="love"))
+        self.assertIsNone(parse_peak_line("# BEGIN DATA", wavetype="rayleigh"))
+        self.assertIsNone(parse_peak_line(txt[:-1] + "0", wavetype="rayleigh"))
+
+        # Bad wavetype, including the spelling used in the file.
+        for wavetype in ["bad", "Rayleigh"]:
+            self.assertRaises(ValueError, parse_peak_line, txt,
+                              wavetype=wavetype)
+
+    def test_get_all(self):
+        txt = "\n".join(["# BEGIN DATA",
+                         "20170609223200.000000 26.78 Rayleigh 0.0018 14.31 0 inf 0 1",
+                         "20170609223200.000000 26.78 Love 0.0002 87.73 0 0 12011.67 1",
+                         "20170609223200.000000 23.91 Rayleigh 0.0014 67.49 1.30 15.60 1990.47 0",
+                         "20170609223200.000000 23.91 Rayleigh 0.0015 107.49 1.30 15.60 1990.47 1",
+                         "20170609223200.000000 20.12 Rayleigh 0.0016 97.49 1.30 15.60 1990.47 1 "])
+        regex = get_all(wavetype="rayleigh", time="20170609223200.000000")
+        self.assertEqual(3, len(regex.findall(txt)))
+
+        # Agrees with parse_peak_line, which ignores trailing whitespace.
+        expected = sum(parse_peak_line(line) is not None
+                       for line in txt.splitlines())
+        self.assertEqual(expected, len(regex.findall(txt)))
+
+    def test_cache(self):
+        # Identical arguments -> identical compiled expression.
+        for func in [get_peak_from_max, get_all]:
+            expected = func(wavetype="love", time="20201021184000.000000")
+            returned = func(wavetype="love", time="20201021184000.000000")
+            self.assertIs(expected, returned)
+
+        # Different arguments -> different compiled expression.
+        a = get_peak_from_max(wavetype="rayleigh")
+        b = get_peak_from_max(wavetype="love")
+        self.assertIsNot(a, b)
+
 if __name__ == "__main__":
     unittest.main()
@@ -107,6 +107,21 @@ class Test_Sensor1C(TestCase):
         mock_trace.stats._format = 1
         self.assertRaises(ValueError, Sensor1C.from_trace, mock_trace)
 
+    def test_from_traces(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            traces = [obspy.read(self.wghs_path + f"{i}.dat")[0]
+                      for i in range(1, 4)]
+        sensor = Sensor1C.from_traces(traces, delay=-0.5, x=3, y=6, z=12)
+        expected = ActiveTimeSeries.from_traces(traces, delay=-0.5)
+        self.assertIsInstance(sensor, Sensor1C)
+        self.assertArrayEqual(expected.amplitude, sensor.amplitude)
+        self.assertEqual(expected.dt, sensor.dt)
+        self.assertEqual(3, sensor.nstacks)
+        self.assertEqual(-0.5, sensor.delay)
+        self.assertListEqual([3, 6, 12],
+                             [getattr(sensor, c) for c in ["x", "y", "z"]])
+
     def test_is_similar(self):
         a = Sensor1C(amplitude=[1.,2,3], dt=1., x=0, y=0, z=0, nstacks=1, delay=0)
 
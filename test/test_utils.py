@@ -18,6 +18,8 @@
 
 import os
 import shutil
+import tempfile
+import warnings
 
 import obspy
 import numpy as np
@@ -33,31 +35,37 @@ class Test_Utils(TestCase):
         cls.full_path = get_full_path(__file__)
 
     def test_extract_mseed(self):
-        startend_fname = self.full_path + "data/utils/extract_startandend.csv"
-        utils.extract_mseed(startend_fname=startend_fname,
-                            network="NW",
-                            data_dir=self.full_path + "data/utils/data_dir/",
-                            output_dir=self.full_path + "data/utils/")
-
-        # Assert directories exist.
-        arrays = ["ex_array_0", "ex_array_1", "ex_array_2"]
-        for array in arrays:
-            self.assertTrue(os.path.isdir(
-                f"{self.full_path}data/utils/{array}"))
-
-        # Open files and assert connets are correct.
-        files = [
-            f"{self.full_path}data/utils/{array}/NW.STN01.{array[3:]}.mseed" for array in arrays]
-        start_seconds = [0, 4*3600, 23*3600 + 30*60]
-        duration_seconds = [1800, 7200, 3600]
-        for _file, start, duration in zip(files, start_seconds, duration_seconds):
-            returned = obspy.read(_file)[0].data
-            expected = np.arange(start, start+duration+1)
-            self.assertArrayEqual(expected, returned)
-
-        # Clean up.
-        for array in arrays:
-            shutil.rmtree(self.full_path + "data/utils/" + array)
+        # Plain and Excel-exported (UTF-8 BOM) start and end times,
+        # extracted serially and in a process pool.
+        for fname, max_workers in [("extract_startandend.csv", 1),
+                                   ("extract_startandend_bom.csv", 1),
+                                   ("extract_startandend.csv", 2)]:
+            startend_fname = self.full_path + "data/utils/" + fname
+            utils.extract_mseed(startend_fname=startend_fname,
+                                network="NW",
+                                data_dir=self.full_path + "data/utils/data_dir/",
+                                output_dir=self.full_path + "data/utils/",
+                                max_workers=max_workers)
+
+            # Assert directories exist.
+            arrays = ["ex_array_0", "ex_array_1", "ex_array_2"]
+            for array in arrays:
+                self.assertTrue(os.path.isdir(
+                    f"{self.full_path}data/utils/{array}"))
+
+            # Open files and assert connets are correct.
+            files = [
+                f"{self.full_path}data/utils/{array}/NW.STN01.{array[3:]}.mseed" for array in arrays]
+            start_seconds = [0, 4*3600, 23*3600 + 30*60]
+            duration_seconds = [1800, 7200, 3600]
+            for _file, start, duration in zip(files, start_seconds, duration_seconds):
+                returned = obspy.read(_file)[0].data
+                expected = np.arange(start, start+duration+1)
+                self.assertArrayEqual(expected, returned)
+
+            # Clean up.
+            for array in arrays:
+                shutil.rmtree(self.full_path + "data/utils/" + array)
 
         # Bad start and end time
         startend_fname_bad = self.full_path + "data/utils/extract_startandend_bad.csv"
@@ -74,6 +82,45 @@ class Test_Utils(TestCase):
                           output_dir=self.full_path + "data/utils/")
 
 
+    def test_extract_mseed_gaps(self):
+        header = ",".join(["folder name", "array name", "station number",
+                           "start year", "start month", "start date",
+                           "start hour", "start minute", "start second",
+                           "end year", "end month", "end date",
+                           "end hour", "end minute", "end second", "notes"])
+        row = "a,array,1,2020,12,31,0,0,0,2020,12,31,1,30,0,gaps"
+        t0 = obspy.UTCDateTime(2020, 12, 31, 0)
+
+        # Gap of 10 samples -> warn; overlap of 1 sample -> no warning.
+        for npts, gapped in [(3590, True), (3601, False)]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                for start, nsamples in [(0, npts), (3600, 3600)]:
+                    trace = obspy.Trace(
+                        data=np.arange(start, start+nsamples, dtype=np.int32),
+                        header={"network": "NW", "station": "STN01",
+                                "starttime": t0 + start, "delta": 1.})
+                    fname = f"NW.STN01_{(t0 + start).strftime('%Y%m%d_%H0000')}.mseed"
+                    trace.write(os.path.join(tmp_dir, fname), format="MSEED")
+                startend_fname = os.path.join(tmp_dir, "startandend.csv")
+                with open(startend_fname, "w") as f:
+                    f.write(f"{header}\n{row}\n")
+
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter("always")
+                    utils.extract_mseed(startend_fname=startend_fname,
+                                        network="NW", data_dir=tmp_dir,
+                                        output_dir=tmp_dir)
+                messages = [str(w.message) for w in caught]
+                self.assertEqual(gapped, any("has gaps" in msg
+                                             for msg in messages))
+
+                returned = obspy.read(os.path.join(tmp_dir, "a",
+                                                   "NW.STN01.array.mseed"))[0].data
+                expected = np.arange(0, 5401)
+                if gapped:
+                    expected[npts:3600] = 0
+                self.assertArrayEqual(expected, returned)
+
 
 if __name__ == "__main__":
     unittest.main()